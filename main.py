@@ -13,40 +13,56 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from src.analyzer import AIAnalyzer
-from src.collector import (
-    ActivityWatchCollector,
-    get_custom_range,
-    get_last_week_range,
-    get_today_range,
-    get_week_range,
-    get_yesterday_range,
-)
-from src.compare import compare_stats, format_comparison_for_prompt
-from src.notifier import send_notification
-from src.processor import DataProcessor
-from src.reporter import ConsolePrinter, ReportGenerator
+# yaml, requests (via the src modules), and the src package itself are
+# imported lazily inside the functions that need them, so --help and
+# argument errors return without paying their import cost.
+
+
+# Parsed config cache keyed by absolute path, storing (mtime, parsed dict).
+# Parsing YAML is expensive relative to a stat + dict lookup, so repeated
+# loads of an unchanged file are served from here.
+_YAML_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
 
 
 def load_config(config_path: str = "config/config.yaml") -> dict[str, Any]:
     """
     Load configuration from a YAML file.
 
+    Parsed results are cached keyed by the file's mtime, so repeated
+    calls only re-parse when the file has changed on disk.
+
     Args:
         config_path: Path to the configuration file.
 
     Returns:
         Configuration dictionary. Returns default config if file not found.
     """
+    import yaml
+
+    try:
+        # libyaml C backend, much faster than the pure-Python loader
+        from yaml import CSafeLoader as yaml_loader
+    except ImportError:
+        # Rebinds the same name with the pure-Python loader type
+        from yaml import SafeLoader as yaml_loader  # type: ignore[assignment]
+
     path = Path(config_path)
     if not path.exists():
         print(f"⚠️  Config file not found: {config_path}, using defaults")
         return get_default_config()
 
+    abs_path = str(path.resolve())
+    mtime = path.stat().st_mtime
+
+    cached = _YAML_CACHE.get(abs_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=yaml_loader)
+
+    _YAML_CACHE[abs_path] = (mtime, config)
+    return config
 
 
 def get_default_config() -> dict[str, Any]:
@@ -146,6 +162,31 @@ def main() -> None:
     6. Save and display report
     """
     args = parse_args()
+
+    import logging
+
+    # The src modules emit progress through logging behind a
+    # NullHandler; give them a bare-message stdout handler so CLI output
+    # looks the same as plain prints.
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", stream=sys.stdout
+    )
+
+    # Deferred until after argument parsing so --help stays fast
+    from src.analyzer import AIAnalyzer
+    from src.collector import (
+        ActivityWatchCollector,
+        get_custom_range,
+        get_last_week_range,
+        get_today_range,
+        get_week_range,
+        get_yesterday_range,
+    )
+    from src.compare import compare_stats, format_comparison_for_prompt
+    from src.notifier import send_notification
+    from src.processor import DataProcessor
+    from src.reporter import ConsolePrinter, ReportGenerator
+
     printer = ConsolePrinter()
 
     # Step 1: Load configuration
@@ -12,11 +12,17 @@ Usage:
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Matches any template placeholder so all substitutions happen in a
+# single pass over the plist content.
+_PLACEHOLDER_RE = re.compile(r"__(?:PYTHON_PATH|PROJECT_PATH)__")
+
 
 def get_python_path() -> str:
     """Get the path to the current Python interpreter."""
@@ -28,8 +34,91 @@ def get_project_path() -> Path:
     return Path(__file__).parent.parent.resolve()
 
 
+def agent_loaded(label: str) -> bool:
+    """
+    Check whether a launchd agent is currently loaded.
+
+    Args:
+        label: The agent label (plist name without the .plist suffix).
+
+    Returns:
+        True if launchctl reports the agent as loaded.
+    """
+    result = subprocess.run(
+        ["launchctl", "list", label],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def install_agent(
+    plist_name: str,
+    scripts_dir: Path,
+    launch_agents_dir: Path,
+    python_path: str,
+    project_path: Path,
+) -> list[str]:
+    """
+    Install and load a single launchd agent.
+
+    Args:
+        plist_name: Name of the plist template file.
+        scripts_dir: Directory containing the plist templates.
+        launch_agents_dir: The user's LaunchAgents directory.
+        python_path: Path to the Python interpreter.
+        project_path: Absolute path to the project root.
+
+    Returns:
+        Status messages describing the install result.
+    """
+    src_plist = scripts_dir / plist_name
+    dst_plist = launch_agents_dir / plist_name
+
+    if not src_plist.exists():
+        return [f"Error: {src_plist} not found"]
+
+    # Read template and replace placeholders in one pass
+    substitutions = {
+        "__PYTHON_PATH__": python_path,
+        "__PROJECT_PATH__": str(project_path),
+    }
+    content = _PLACEHOLDER_RE.sub(
+        lambda match: substitutions[match.group(0)],
+        src_plist.read_text(),
+    )
+
+    # Write to LaunchAgents directory
+    dst_plist.write_text(content)
+    messages = [f"Installed: {dst_plist}"]
+
+    # Reload the agent; skip the unload subprocess when it isn't loaded
+    label = plist_name.removesuffix(".plist")
+    if agent_loaded(label):
+        subprocess.run(
+            ["launchctl", "unload", str(dst_plist)],
+            capture_output=True,
+        )
+    result = subprocess.run(
+        ["launchctl", "load", str(dst_plist)],
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode == 0:
+        messages.append(f"Loaded: {plist_name}")
+    else:
+        messages.append(f"Failed to load {plist_name}: {result.stderr}")
+
+    return messages
+
+
 def install_launchd_agents() -> None:
-    """Install launchd agents for daily and weekly reports."""
+    """Install launchd agents for daily and weekly reports.
+
+    The agents are installed concurrently: each install spends most of
+    its time waiting on launchctl subprocesses, so running them in a
+    thread pool overlaps the waits.
+    """
     project_path = get_project_path()
     python_path = get_python_path()
     scripts_dir = project_path / "scripts"
@@ -47,38 +136,16 @@ def install_launchd_agents() -> None:
         "com.efficiency-tracker.weekly.plist",
     ]
 
-    for plist_name in plist_files:
-        src_plist = scripts_dir / plist_name
-        dst_plist = launch_agents_dir / plist_name
-
-        if not src_plist.exists():
-            print(f"Error: {src_plist} not found")
-            continue
-
-        # Read template and replace placeholders
-        content = src_plist.read_text()
-        content = content.replace("__PYTHON_PATH__", python_path)
-        content = content.replace("__PROJECT_PATH__", str(project_path))
-
-        # Write to LaunchAgents directory
-        dst_plist.write_text(content)
-        print(f"Installed: {dst_plist}")
-
-        # Load the agent
-        subprocess.run(
-            ["launchctl", "unload", str(dst_plist)],
-            capture_output=True,
+    with ThreadPoolExecutor(max_workers=len(plist_files)) as executor:
+        results = executor.map(
+            lambda name: install_agent(
+                name, scripts_dir, launch_agents_dir, python_path, project_path
+            ),
+            plist_files,
         )
-        result = subprocess.run(
-            ["launchctl", "load", str(dst_plist)],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
-            print(f"Loaded: {plist_name}")
-        else:
-            print(f"Failed to load {plist_name}: {result.stderr}")
+        for messages in results:
+            for message in messages:
+                print(message)
 
 
 def main() -> None:
@@ -16,6 +16,23 @@ import sys
 from pathlib import Path
 
 
+def agent_loaded(label: str) -> bool:
+    """
+    Check whether a launchd agent is currently loaded.
+
+    Args:
+        label: The agent label (plist name without the .plist suffix).
+
+    Returns:
+        True if launchctl reports the agent as loaded.
+    """
+    result = subprocess.run(
+        ["launchctl", "list", label],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
 def uninstall_launchd_agents() -> None:
     """Uninstall launchd agents for daily and weekly reports."""
     launch_agents_dir = Path.home() / "Library" / "LaunchAgents"
@@ -32,17 +49,20 @@ def uninstall_launchd_agents() -> None:
             print(f"Not found (skipping): {plist_name}")
             continue
 
-        # Unload the agent
-        result = subprocess.run(
-            ["launchctl", "unload", str(plist_path)],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0:
-            print(f"Unloaded: {plist_name}")
+        # Unload the agent; skip the subprocess when it isn't loaded
+        if agent_loaded(plist_name.removesuffix(".plist")):
+            result = subprocess.run(
+                ["launchctl", "unload", str(plist_path)],
+                capture_output=True,
+                text=True,
+            )
+
+            if result.returncode == 0:
+                print(f"Unloaded: {plist_name}")
+            else:
+                print(f"Warning: Failed to unload {plist_name}: {result.stderr}")
         else:
-            print(f"Warning: Failed to unload {plist_name}: {result.stderr}")
+            print(f"Not loaded (skipping unload): {plist_name}")
 
         # Remove the plist file
         plist_path.unlink()
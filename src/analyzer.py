@@ -7,12 +7,124 @@ efficiency analysis reports from processed ActivityWatch data.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 import requests
 
+try:
+    # Optional C-accelerated JSON codec; falls back to the stdlib
+    import orjson
+
+    def _json_loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Known content locations within a chat-completion choice, tried in
+# order: standard OpenAI message.content, the reasoning-model fallback
+# (like o1/DeepSeek, where content may be empty but reasoning_content
+# holds text), and APIs that put 'text' on the choice directly. Keeping
+# these as precomputed key paths makes _parse_response a data-driven
+# walk instead of a branch ladder.
+_CONTENT_PATHS: tuple[tuple[str, ...], ...] = (
+    ("message", "content"),
+    ("message", "reasoning_content"),
+    ("text",),
+)
+
+
+def _walk_path(obj: Any, path: tuple[str, ...]) -> str | None:
+    """
+    Follow a precomputed key path into a nested dict.
+
+    Args:
+        obj: The object to walk into.
+        path: Keys to follow, outermost first.
+
+    Returns:
+        The non-empty string at the end of the path, or None if any key
+        is missing or the value is empty or not a string.
+    """
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    if isinstance(obj, str) and obj:
+        return obj
+    return None
+
+
+# Static prompt text, built once at import time so build_prompt and
+# _build_payload only format the variable fields per call.
+_SYSTEM_PROMPT = (
+    "你是一位专业的个人效率分析师。你的任务是分析用户的电脑使用数据，"
+    "提供客观、有洞察力的效率报告。\n\n"
+    "要求：\n"
+    "- 基于数据说话，不要编造或假设不存在的信息\n"
+    "- 语气友好但专业，像一位关心用户的效率教练\n"
+    "- 建议要具体可行，不要泛泛而谈\n"
+    "- 使用 Markdown 格式输出，结构清晰"
+)
+
+_PROMPT_INSTRUCTIONS = """---
+
+请分析上述数据，帮我发现行为模式和效率洞察。
+
+## 分析要点
+
+1. **打断模式**：有没有某个应用/网站经常打断工作流？从时间线中寻找线索。
+2. **低效时段**：哪个时间段切换最频繁？这可能是效率较低的时段。
+3. **专注时段**：从连续使用段落中，找出能保持较长专注的时间段。
+4. **趋势变化**：对比历史数据，有什么显著的进步或退步？
+5. **有趣发现**：任何你注意到的模式、规律或异常。
+
+## 输出格式
+
+### 📊 整体概览
+（1-2句话总结本周期的整体状况）
+
+### ⏰ 时间分配
+（指出时间主要花在哪些应用/类别，占比最高的2-3项）
+
+### 💡 发现与洞察
+（基于行为数据发现的具体模式，用要点列出，要具体到时间点或应用）
+
+### 📈 趋势变化
+（如有历史对比数据，指出显著的进步或退步，没有历史数据则跳过此节）
+
+### ✅ 改进建议
+（1-2条具体可行的建议，针对发现的问题）
+例如好的建议："14:00-15:00 切换频繁，考虑把会议安排在这个时段"
+例如差的建议："建议减少切换次数"（太泛泛）
+
+### 🎯 锐评
+（用一句犀利、直接的话点评今天的工作状态，可以毒舌但要基于数据，像朋友间的吐槽）
+例如："花了3小时在浏览器上，你是在工作还是在网上冲浪？"
+例如："切换了200次应用，你的注意力比金鱼还短。"
+例如："今天状态不错，终于像个正经打工人了。"
+
+注意：
+- 基于数据说话，不要编造不存在的信息
+- 建议要具体、可执行，不要泛泛而谈
+- 锐评要有趣、直接，但不要人身攻击
+- 严格按照上述格式输出，不要添加额外章节
+"""
+
 
 class AIAnalyzer:
     """
@@ -64,6 +176,10 @@ class AIAnalyzer:
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self._session: Any | None = None  # Shared aiohttp.ClientSession
+        # Persistent session so repeated sync calls reuse pooled connections
+        # instead of paying TCP + TLS setup per request.
+        self._http = requests.Session()
 
     def build_prompt(
         self,
@@ -94,20 +210,20 @@ class AIAnalyzer:
 
         # Basic statistics for reference
         app_list = "\n".join(
-            [f"  - {app}: {hours}h" for app, hours in stats["by_app"]]
+            f"  - {app}: {hours}h" for app, hours in stats["by_app"]
         )
         category_list = "\n".join(
-            [f"  - {cat}: {hours}h" for cat, hours in stats["by_category"]]
+            f"  - {cat}: {hours}h" for cat, hours in stats["by_category"]
         )
 
         # Editor statistics section
         editor_section = ""
         if stats["editor"]["by_language"]:
             lang_list = "\n".join(
-                [f"  - {lang}: {h}h" for lang, h in stats["editor"]["by_language"]]
+                f"  - {lang}: {h}h" for lang, h in stats["editor"]["by_language"]
             )
             proj_list = "\n".join(
-                [f"  - {proj}: {h}h" for proj, h in stats["editor"]["by_project"][:3]]
+                f"  - {proj}: {h}h" for proj, h in stats["editor"]["by_project"][:3]
             )
             editor_section = f"""
 ## 编程统计（共 {stats['editor']['total_hours']}h）
@@ -184,50 +300,65 @@ class AIAnalyzer:
 {app_list}
 
 {trend_section}
----
-
-请分析上述数据，帮我发现行为模式和效率洞察。
+{_PROMPT_INSTRUCTIONS}"""
+        return prompt, data_summary
 
-## 分析要点
+    def _build_headers(self) -> dict[str, str]:
+        """
+        Build the HTTP headers for an API request.
 
-1. **打断模式**：有没有某个应用/网站经常打断工作流？从时间线中寻找线索。
-2. **低效时段**：哪个时间段切换最频繁？这可能是效率较低的时段。
-3. **专注时段**：从连续使用段落中，找出能保持较长专注的时间段。
-4. **趋势变化**：对比历史数据，有什么显著的进步或退步？
-5. **有趣发现**：任何你注意到的模式、规律或异常。
+        Returns:
+            Headers dictionary with authorization and content type.
+        """
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
-## 输出格式
+    def _build_payload(self, prompt: str) -> dict[str, Any]:
+        """
+        Build the chat-completions request payload.
 
-### 📊 整体概览
-（1-2句话总结本周期的整体状况）
+        Args:
+            prompt: The analysis prompt to send to the AI.
 
-### ⏰ 时间分配
-（指出时间主要花在哪些应用/类别，占比最高的2-3项）
+        Returns:
+            The request payload dictionary.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
 
-### 💡 发现与洞察
-（基于行为数据发现的具体模式，用要点列出，要具体到时间点或应用）
+    @staticmethod
+    def _parse_response(result: dict[str, Any]) -> str:
+        """
+        Extract the report text from an API response.
 
-### 📈 趋势变化
-（如有历史对比数据，指出显著的进步或退步，没有历史数据则跳过此节）
+        Walks the precomputed _CONTENT_PATHS key paths, which cover the
+        standard OpenAI format, reasoning model responses (like
+        o1/DeepSeek), and APIs that return 'text' directly.
 
-### ✅ 改进建议
-（1-2条具体可行的建议，针对发现的问题）
-例如好的建议："14:00-15:00 切换频繁，考虑把会议安排在这个时段"
-例如差的建议："建议减少切换次数"（太泛泛）
+        Args:
+            result: The decoded JSON response body.
 
-### 🎯 锐评
-（用一句犀利、直接的话点评今天的工作状态，可以毒舌但要基于数据，像朋友间的吐槽）
-例如："花了3小时在浏览器上，你是在工作还是在网上冲浪？"
-例如："切换了200次应用，你的注意力比金鱼还短。"
-例如："今天状态不错，终于像个正经打工人了。"
+        Returns:
+            The report text, or an error message if the format is unexpected.
+        """
+        if "choices" in result and result["choices"]:
+            choice = result["choices"][0]
+            for path in _CONTENT_PATHS:
+                content = _walk_path(choice, path)
+                if content:
+                    return content
 
-注意：
-- 基于数据说话，不要编造不存在的信息
-- 建议要具体、可执行，不要泛泛而谈
-- 锐评要有趣、直接，但不要人身攻击
-- 严格按照上述格式输出，不要添加额外章节
-"""
-        return prompt, data_summary
+        # If we get here, the response format is unexpected
+        return f"AI 响应格式异常: {result}"
 
     def analyze(self, prompt: str) -> str:
         """
@@ -240,69 +371,174 @@ class AIAnalyzer:
             The AI-generated analysis report, or an error message if the
             API call fails.
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "你是一位专业的个人效率分析师。你的任务是分析用户的电脑使用数据，"
-                        "提供客观、有洞察力的效率报告。\n\n"
-                        "要求：\n"
-                        "- 基于数据说话，不要编造或假设不存在的信息\n"
-                        "- 语气友好但专业，像一位关心用户的效率教练\n"
-                        "- 建议要具体可行，不要泛泛而谈\n"
-                        "- 使用 Markdown 格式输出，结构清晰"
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-        }
-
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 f"{self.api_base}/chat/completions",
-                headers=headers,
-                json=payload,
+                headers=self._build_headers(),
+                data=_json_dumps(self._build_payload(prompt)),
                 timeout=120,
             )
             resp.raise_for_status()
-            result = resp.json()
-
-            # Handle different response formats
-            if "choices" in result and result["choices"]:
-                choice = result["choices"][0]
-                message = choice.get("message", {})
-
-                # Standard OpenAI format
-                if "content" in message and message["content"]:
-                    return message["content"]
-
-                # Reasoning model format (like o1/DeepSeek) - has reasoning_content
-                if "reasoning_content" in message:
-                    # For reasoning models, the actual answer should be in 'content'
-                    # If content is empty but we have reasoning, return reasoning
-                    content = message.get("content") or message.get("reasoning_content")
-                    if content:
-                        return content
-
-                # Some APIs use 'text' directly
-                if "text" in choice:
-                    return choice["text"]
-
-            # If we get here, the response format is unexpected
-            return f"AI 响应格式异常: {result}"
+            return self._parse_response(_json_loads(resp.content))
 
         except requests.exceptions.Timeout:
             return "AI 调用超时，请稍后重试"
         except requests.exceptions.RequestException as e:
             return f"AI 调用失败: {e}"
-        except (KeyError, IndexError) as e:
+        # ValueError covers the JSON decode errors (orjson and stdlib)
+        # raised when a 200 response carries a non-JSON body
+        except (KeyError, IndexError, ValueError) as e:
+            return f"AI 响应解析失败: {e}"
+
+    async def _ensure_session(self) -> Any:
+        """
+        Lazily create (or recreate) the shared aiohttp session.
+
+        The session holds the HTTP connection pool, so concurrent
+        analyze_async calls reuse connections instead of opening new ones.
+
+        Returns:
+            The shared aiohttp.ClientSession instance.
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=120)
+            )
+        return self._session
+
+    async def analyze_async(self, prompt: str) -> str:
+        """
+        Asynchronously call the AI API to analyze the data.
+
+        Multiple analyses (e.g., day + week + trend comparisons) can be
+        dispatched concurrently with asyncio.gather, cutting total latency
+        from sum-of-calls to max-of-calls. Requires the optional aiohttp
+        dependency.
+
+        Args:
+            prompt: The analysis prompt to send to the AI.
+
+        Returns:
+            The AI-generated analysis report, or an error message if the
+            API call fails.
+        """
+        import aiohttp
+
+        try:
+            session = await self._ensure_session()
+            async with session.post(
+                f"{self.api_base}/chat/completions",
+                headers=self._build_headers(),
+                json=self._build_payload(prompt),
+            ) as resp:
+                resp.raise_for_status()
+                result = await resp.json()
+            return self._parse_response(result)
+
+        except asyncio.TimeoutError:
+            return "AI 调用超时，请稍后重试"
+        except aiohttp.ClientError as e:
+            return f"AI 调用失败: {e}"
+        # resp.json() raises json.JSONDecodeError (a ValueError) when
+        # the body is not valid JSON
+        except (KeyError, IndexError, ValueError) as e:
             return f"AI 响应解析失败: {e}"
+
+    def analyze_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Call the AI API in streaming mode and yield report chunks.
+
+        Uses the server-sent events (SSE) stream of the chat-completions
+        API, so the first tokens arrive as soon as the model produces them
+        instead of after the full payload is generated. Callers can print
+        chunks progressively or join them into the full report.
+
+        Args:
+            prompt: The analysis prompt to send to the AI.
+
+        Yields:
+            Report text fragments in arrival order. On failure, a single
+            error message is yielded.
+        """
+        payload = self._build_payload(prompt)
+        payload["stream"] = True
+
+        try:
+            with self._http.post(
+                f"{self.api_base}/chat/completions",
+                headers=self._build_headers(),
+                data=_json_dumps(payload),
+                timeout=120,
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+
+                for line in resp.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+
+                    try:
+                        chunk = _json_loads(data)
+                    except ValueError:
+                        continue
+
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+
+        except requests.exceptions.Timeout:
+            yield "AI 调用超时，请稍后重试"
+        except requests.exceptions.RequestException as e:
+            yield f"AI 调用失败: {e}"
+
+    def analyze_many(self, prompts: list[str]) -> list[str]:
+        """
+        Analyze a batch of prompts concurrently.
+
+        All prompts are dispatched in one micro-batch over the shared
+        session, so generating multiple reports (e.g., batched re-runs or
+        parallel trend queries) costs roughly one round-trip instead of
+        one per prompt. Requires the optional aiohttp dependency.
+
+        Args:
+            prompts: The analysis prompts to send to the AI.
+
+        Returns:
+            The AI-generated reports, in the same order as the prompts.
+        """
+
+        async def _run_batch() -> list[str]:
+            async with self:
+                tasks = [self.analyze_async(p) for p in prompts]
+                return list(await asyncio.gather(*tasks))
+
+        if not prompts:
+            return []
+        return asyncio.run(_run_batch())
+
+    def close(self) -> None:
+        """Close the persistent sync session and its connection pool."""
+        self._http.close()
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> AIAnalyzer:
+        """Enter the async context, creating the shared session."""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the async context, closing the shared session."""
+        await self.aclose()
@@ -8,11 +8,90 @@ and utility functions for generating time ranges.
 
 from __future__ import annotations
 
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import requests
 
+try:
+    # Optional C-accelerated JSON codec; falls back to the stdlib
+    import orjson
+
+    def _json_loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def _json_loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# On-disk location for the bucket listing caches shared between runs
+_BUCKETS_CACHE_DIR = Path.home() / ".cache" / "efficiency-tracker"
+
+
+def _buckets_cache_path(host: str) -> Path:
+    """
+    Build the bucket cache path for an ActivityWatch host.
+
+    The filename carries a digest of the host so collectors pointed at
+    different servers never serve each other's cached listings.
+
+    Args:
+        host: The ActivityWatch server URL.
+
+    Returns:
+        The per-host cache file path.
+    """
+    digest = hashlib.sha1(host.encode("utf-8")).hexdigest()[:12]
+    return _BUCKETS_CACHE_DIR / f"buckets-{digest}.json"
+
+
+def _first_bucket(buckets: dict[str, Any], client_prefix: str) -> str | None:
+    """
+    Find a single bucket ID by client name prefix in a bucket listing.
+
+    Args:
+        buckets: Bucket listing as returned by the buckets API.
+        client_prefix: The prefix to match against bucket client names.
+
+    Returns:
+        The first matching bucket ID, or None.
+    """
+    for bucket_id, info in buckets.items():
+        if info.get("client", "").startswith(client_prefix):
+            return bucket_id
+    return None
+
+
+def _all_buckets(buckets: dict[str, Any], client_prefix: str) -> list[str]:
+    """
+    Find all bucket IDs matching a client name prefix in a bucket listing.
+
+    Args:
+        buckets: Bucket listing as returned by the buckets API.
+        client_prefix: The prefix to match against bucket client names.
+
+    Returns:
+        All matching bucket IDs.
+    """
+    return [
+        bucket_id
+        for bucket_id, info in buckets.items()
+        if info.get("client", "").startswith(client_prefix)
+    ]
+
 
 class ActivityWatchCollector:
     """
@@ -30,21 +109,42 @@ class ActivityWatchCollector:
         >>> events = collector.get_events("aw-watcher-window_hostname", start, end)
     """
 
-    def __init__(self, host: str = "http://localhost:5600") -> None:
+    def __init__(
+        self,
+        host: str = "http://localhost:5600",
+        buckets_cache_ttl: float = 300.0,
+    ) -> None:
         """
         Initialize the collector.
 
         Args:
             host: The ActivityWatch server URL. Defaults to localhost:5600.
+            buckets_cache_ttl: How long (in seconds) a persisted bucket
+                listing stays valid across runs. Set to 0 to disable the
+                on-disk cache. Defaults to 5 minutes.
         """
         self.host = host
+        self.buckets_cache_ttl = buckets_cache_ttl
         self._buckets_cache: dict[str, Any] | None = None
+        self._buckets_cache_file = _buckets_cache_path(host)
+        # Persistent session so repeated API calls reuse pooled
+        # keep-alive connections instead of reconnecting per request.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def get_buckets(self) -> dict[str, Any]:
         """
         Retrieve all buckets from the ActivityWatch server.
 
-        Results are cached after the first call.
+        Results are cached in memory after the first call, and persisted
+        to disk so repeated runs within the TTL (e.g., scheduler
+        back-to-back day + week reports) skip the API round trip
+        entirely. Bucket listings change only when watchers are added or
+        removed, so a short TTL is safe.
 
         Returns:
             A dictionary mapping bucket IDs to their metadata.
@@ -53,11 +153,53 @@ class ActivityWatchCollector:
             requests.HTTPError: If the API request fails.
         """
         if self._buckets_cache is None:
-            resp = requests.get(f"{self.host}/api/0/buckets", timeout=30)
+            self._buckets_cache = self._load_buckets_from_disk()
+
+        if self._buckets_cache is None:
+            resp = self._session.get(f"{self.host}/api/0/buckets", timeout=30)
             resp.raise_for_status()
-            self._buckets_cache = resp.json()
+            self._buckets_cache = _json_loads(resp.content)
+            self._save_buckets_to_disk(self._buckets_cache)
+
         return self._buckets_cache
 
+    def _load_buckets_from_disk(self) -> dict[str, Any] | None:
+        """
+        Load the persisted bucket listing if it is still fresh.
+
+        Returns:
+            The cached listing, or None if caching is disabled, the file
+            is missing or unreadable, or its TTL has expired.
+        """
+        if self.buckets_cache_ttl <= 0:
+            return None
+        cache_file = self._buckets_cache_file
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.buckets_cache_ttl:
+                return None
+            buckets: dict[str, Any] = _json_loads(cache_file.read_bytes())
+            return buckets
+        except (OSError, ValueError):
+            return None
+
+    def _save_buckets_to_disk(self, buckets: dict[str, Any]) -> None:
+        """
+        Persist the bucket listing for reuse by later runs.
+
+        Failures are ignored: the disk cache is purely an optimization.
+
+        Args:
+            buckets: The bucket listing to persist.
+        """
+        if self.buckets_cache_ttl <= 0:
+            return
+        cache_file = self._buckets_cache_file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(_json_dumps(buckets))
+        except OSError:
+            pass
+
     def get_events(
         self,
         bucket_id: str,
@@ -82,13 +224,36 @@ class ActivityWatchCollector:
             "start": start.isoformat(),
             "end": end.isoformat(),
         }
-        resp = requests.get(
+        return self._fetch_events(bucket_id, params)
+
+    def _fetch_events(
+        self,
+        bucket_id: str,
+        params: dict[str, str],
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch events for a bucket using pre-rendered query parameters.
+
+        Lets collect_all format the start/end timestamps once and reuse
+        the strings across every bucket fetch.
+
+        Args:
+            bucket_id: The ID of the bucket to query.
+            params: Query parameters with pre-rendered ISO timestamps.
+
+        Returns:
+            A list of event dictionaries.
+
+        Raises:
+            requests.HTTPError: If the API request fails.
+        """
+        resp = self._session.get(
             f"{self.host}/api/0/buckets/{bucket_id}/events",
             params=params,
             timeout=30,
         )
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     def find_bucket(self, client_prefix: str) -> str | None:
         """
@@ -100,11 +265,7 @@ class ActivityWatchCollector:
         Returns:
             The bucket ID if found, None otherwise.
         """
-        buckets = self.get_buckets()
-        for bucket_id, info in buckets.items():
-            if info.get("client", "").startswith(client_prefix):
-                return bucket_id
-        return None
+        return _first_bucket(self.get_buckets(), client_prefix)
 
     def find_all_buckets(self, client_prefix: str) -> list[str]:
         """
@@ -116,12 +277,7 @@ class ActivityWatchCollector:
         Returns:
             A list of matching bucket IDs.
         """
-        buckets = self.get_buckets()
-        return [
-            bucket_id
-            for bucket_id, info in buckets.items()
-            if info.get("client", "").startswith(client_prefix)
-        ]
+        return _all_buckets(self.get_buckets(), client_prefix)
 
     def collect_all(
         self,
@@ -149,14 +305,16 @@ class ActivityWatchCollector:
                 - editor: List of editor events
                 - buckets_info: Metadata about found buckets
         """
-        # Find buckets
-        window_bucket = self.find_bucket("aw-watcher-window")
-        afk_bucket = self.find_bucket("aw-watcher-afk")
-        browser_bucket = self.find_bucket("aw-watcher-web")
+        # Find buckets from a single snapshot of the bucket listing, so
+        # discovery costs one API call regardless of prefix count
+        buckets = self.get_buckets()
+        window_bucket = _first_bucket(buckets, "aw-watcher-window")
+        afk_bucket = _first_bucket(buckets, "aw-watcher-afk")
+        browser_bucket = _first_bucket(buckets, "aw-watcher-web")
 
         editor_buckets: list[str] = []
         for prefix in editor_prefixes:
-            editor_buckets.extend(self.find_all_buckets(prefix))
+            editor_buckets.extend(_all_buckets(buckets, prefix))
 
         # Collect events
         result: dict[str, Any] = {
@@ -172,17 +330,33 @@ class ActivityWatchCollector:
             },
         }
 
+        # Fetch all buckets concurrently; each request mostly waits on
+        # the AW server, so the round-trips overlap.
+        fetch_jobs: list[tuple[str, str]] = []
         if window_bucket:
-            result["window"] = self.get_events(window_bucket, start, end)
-
+            fetch_jobs.append(("window", window_bucket))
         if afk_bucket:
-            result["afk"] = self.get_events(afk_bucket, start, end)
-
+            fetch_jobs.append(("afk", afk_bucket))
         if browser_bucket:
-            result["browser"] = self.get_events(browser_bucket, start, end)
-
+            fetch_jobs.append(("browser", browser_bucket))
         for bucket in editor_buckets:
-            result["editor"].extend(self.get_events(bucket, start, end))
+            fetch_jobs.append(("editor", bucket))
+
+        if fetch_jobs:
+            # Render the timestamps once; every bucket fetch shares them
+            params = {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+            }
+            with ThreadPoolExecutor(
+                max_workers=min(len(fetch_jobs), 8)
+            ) as executor:
+                futures = [
+                    (key, executor.submit(self._fetch_events, bucket, params))
+                    for key, bucket in fetch_jobs
+                ]
+                for key, future in futures:
+                    result[key].extend(future.result())
 
         return result
 
@@ -192,6 +366,25 @@ class ActivityWatchCollector:
 # =============================================================================
 
 
+def _midnight(dt: datetime) -> datetime:
+    """
+    Zero out the time fields of a datetime.
+
+    Shared by the range helpers so each computes its midnight boundary
+    from a single datetime.now() sample instead of chaining replace
+    calls inline. Midnight is always derived from the caller's sample
+    rather than cached globally, so a process running across a day
+    rollover can never serve yesterday's boundary.
+
+    Args:
+        dt: The datetime to truncate.
+
+    Returns:
+        The same date at 00:00:00.000000.
+    """
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 def get_today_range() -> tuple[datetime, datetime]:
     """
     Get the time range for today.
@@ -200,8 +393,7 @@ def get_today_range() -> tuple[datetime, datetime]:
         A tuple of (start_of_today, now).
     """
     now = datetime.now()
-    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    return start, now
+    return _midnight(now), now
 
 
 def get_week_range() -> tuple[datetime, datetime]:
@@ -212,8 +404,7 @@ def get_week_range() -> tuple[datetime, datetime]:
         A tuple of (start_of_week, now).
     """
     now = datetime.now()
-    start = now - timedelta(days=now.weekday())
-    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    start = _midnight(now - timedelta(days=now.weekday()))
     return start, now
 
 
@@ -243,9 +434,8 @@ def get_yesterday_range() -> tuple[datetime, datetime]:
     Returns:
         A tuple of (start_of_yesterday, end_of_yesterday).
     """
-    now = datetime.now()
-    yesterday = now - timedelta(days=1)
-    start = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday = datetime.now() - timedelta(days=1)
+    start = _midnight(yesterday)
     end = yesterday.replace(hour=23, minute=59, second=59, microsecond=999999)
     return start, end
 
@@ -259,8 +449,7 @@ def get_last_week_range() -> tuple[datetime, datetime]:
     """
     now = datetime.now()
     # Start of this week (Monday)
-    this_week_start = now - timedelta(days=now.weekday())
-    this_week_start = this_week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    this_week_start = _midnight(now - timedelta(days=now.weekday()))
     # Last week is 7 days before this week
     last_week_start = this_week_start - timedelta(days=7)
     last_week_end = this_week_start - timedelta(seconds=1)  # Sunday 23:59:59
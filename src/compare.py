@@ -7,24 +7,31 @@ to identify trends and changes in work patterns.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
+# Matches the switch count in hourly view lines like "09:00: 3次" or
+# "10:00: 8次 ← 切换频繁".
+_SWITCH_COUNT_RE = re.compile(r"(\d+)次")
 
-def calculate_change(current: float, previous: float) -> dict[str, Any]:
+
+@lru_cache(maxsize=256)
+def _change_fields(current: float, previous: float) -> tuple[float, float | None, str]:
     """
-    Calculate the change between two values.
+    Compute the memoizable (diff, percent, direction) fields of a change.
+
+    Cached so repeated comparisons of the same value pair (common when
+    several metrics sit at 0 or identical hour counts) skip the
+    arithmetic. Returns an immutable tuple so cache entries can never be
+    mutated by callers.
 
     Args:
         current: The current period value.
         previous: The previous period value.
 
     Returns:
-        A dictionary containing:
-            - current: The current value
-            - previous: The previous value
-            - diff: The absolute difference
-            - percent: The percentage change (None if previous is 0)
-            - direction: "up", "down", or "same"
+        A (diff, percent, direction) tuple.
     """
     diff = current - previous
 
@@ -40,10 +47,31 @@ def calculate_change(current: float, previous: float) -> dict[str, Any]:
         else:
             direction = "down"
 
+    return round(diff, 1), percent, direction
+
+
+def calculate_change(current: float, previous: float) -> dict[str, Any]:
+    """
+    Calculate the change between two values.
+
+    Args:
+        current: The current period value.
+        previous: The previous period value.
+
+    Returns:
+        A dictionary containing:
+            - current: The current value
+            - previous: The previous value
+            - diff: The absolute difference
+            - percent: The percentage change (None if previous is 0)
+            - direction: "up", "down", or "same"
+    """
+    diff, percent, direction = _change_fields(current, previous)
+
     return {
         "current": current,
         "previous": previous,
-        "diff": round(diff, 1),
+        "diff": diff,
         "percent": percent,
         "direction": direction,
     }
@@ -96,12 +124,14 @@ def compare_stats(
         round(previous_rate, 1),
     )
 
-    # Compare top apps
-    current_apps = {app: hours for app, hours in current_stats["by_app"]}
-    previous_apps = {app: hours for app, hours in previous_stats["by_app"]}
+    # Compare top apps over the merged key set in one pass, so apps that
+    # dropped out of the current period entirely still register as changes
+    current_apps = dict(current_stats["by_app"])
+    previous_apps = dict(previous_stats["by_app"])
 
     app_changes = []
-    for app, current_hours in current_apps.items():
+    for app in current_apps.keys() | previous_apps.keys():
+        current_hours = current_apps.get(app, 0)
         previous_hours = previous_apps.get(app, 0)
         if current_hours >= 0.5 or previous_hours >= 0.5:  # Only significant apps
             change = calculate_change(current_hours, previous_hours)
@@ -135,20 +165,30 @@ def _count_total_switches(stats: dict[str, Any]) -> int | None:
         Total switch count, or None if data not available.
     """
     views = stats.get("views", {})
-    hourly_switches = views.get("hourly_switches", "")
+    return _count_switches_text(views.get("hourly_switches", ""))
+
 
+@lru_cache(maxsize=64)
+def _count_switches_text(hourly_switches: str) -> int | None:
+    """
+    Parse and sum switch counts from a rendered hourly switches view.
+
+    Memoized on the raw view string, since the same stats dictionary is
+    parsed again whenever it appears on the historical side of a later
+    comparison.
+
+    Args:
+        hourly_switches: The hourly switches view text.
+
+    Returns:
+        Total switch count, or None if data not available.
+    """
     if not hourly_switches or hourly_switches.startswith("（"):
         return None
 
-    total = 0
-    for line in hourly_switches.split("\n"):
-        # Format: "09:00: 3次" or "10:00: 8次 ← 切换频繁"
-        if "次" in line:
-            try:
-                count_str = line.split(":")[1].split("次")[0].strip()
-                total += int(count_str)
-            except (IndexError, ValueError):
-                continue
+    total = sum(
+        int(count) for count in _SWITCH_COUNT_RE.findall(hourly_switches)
+    )
 
     return total if total > 0 else None
 
@@ -6,14 +6,15 @@ This module handles sending report notifications via DingTalk and Email.
 
 from __future__ import annotations
 
-import smtplib
-import ssl
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import time
 from typing import Any
 
 import requests
 
+# smtplib/ssl/email.mime are imported inside EmailNotifier.send: they
+# are comparatively heavy stdlib modules and only needed when the email
+# channel is actually enabled.
+
 
 class DingTalkNotifier:
     """
@@ -53,18 +54,23 @@ class DingTalkNotifier:
         self.agent_id = agent_id
         self.user_id = user_id
         self._access_token: str | None = None
+        self._token_expires_at: float = 0.0
 
     def _get_access_token(self) -> str:
         """
         Get access token from DingTalk API.
 
+        Tokens are cached until shortly before their server-reported
+        expiry, so long-lived notifier instances refresh instead of
+        reusing a stale token.
+
         Returns:
             The access token string.
 
         Raises:
             RuntimeError: If token retrieval fails.
         """
-        if self._access_token:
+        if self._access_token and time.time() < self._token_expires_at:
             return self._access_token
 
         url = "https://oapi.dingtalk.com/gettoken"
@@ -81,12 +87,52 @@ class DingTalkNotifier:
             raise RuntimeError(f"Failed to get DingTalk token: {result}")
 
         self._access_token = result["access_token"]
+        # Refresh 60s early to avoid racing the server-side expiry
+        self._token_expires_at = time.time() + result.get("expires_in", 7200) - 60
         return self._access_token
 
     def send(self, title: str, content: str) -> bool:
         """
         Send a work notification to the user.
 
+        Args:
+            title: The message title.
+            content: The message content (supports markdown).
+
+        Returns:
+            True if the message was sent successfully, False otherwise.
+        """
+        return self._send_markdown(title, content)
+
+    def send_batch(self, messages: list[tuple[str, str]]) -> bool:
+        """
+        Send several reports coalesced into a single work notification.
+
+        Batched re-runs (e.g., day + week generated together) would
+        otherwise cost one token check and one asyncsend_v2 round-trip
+        per report; coalescing them sends everything in one API call.
+
+        Args:
+            messages: (title, content) pairs to send, in display order.
+
+        Returns:
+            True if the batch was sent successfully, False otherwise.
+        """
+        if not messages:
+            return True
+        if len(messages) == 1:
+            return self._send_markdown(*messages[0])
+
+        title = f"{messages[0][0]} 等 {len(messages)} 条报告"
+        text = "\n\n---\n\n".join(
+            f"## {msg_title}\n\n{content}" for msg_title, content in messages
+        )
+        return self._send_markdown(title, text)
+
+    def _send_markdown(self, title: str, content: str) -> bool:
+        """
+        Send a markdown work notification via asyncsend_v2.
+
         Args:
             title: The message title.
             content: The message content (supports markdown).
@@ -181,16 +227,18 @@ class EmailNotifier:
         Returns:
             True if the email was sent successfully, False otherwise.
         """
+        import smtplib
+        import ssl
+        from email.mime.text import MIMEText
+
         try:
-            msg = MIMEMultipart("alternative")
+            # Single plain-text part (markdown), so no multipart wrapper
+            # is needed
+            msg = MIMEText(content, "plain", "utf-8")
             msg["Subject"] = title
             msg["From"] = self.smtp_user
             msg["To"] = self.to_address
 
-            # Send as plain text (markdown)
-            text_part = MIMEText(content, "plain", "utf-8")
-            msg.attach(text_part)
-
             if self.use_ssl:
                 context = ssl.create_default_context()
                 with smtplib.SMTP_SSL(
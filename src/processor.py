@@ -7,10 +7,24 @@ for ActivityWatch event data. It also generates behavior views for AI analysis.
 
 from __future__ import annotations
 
-from collections import defaultdict
+import os
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from typing import Any
-from urllib.parse import urlparse
+
+# Shared fallback for events missing a "data" payload, so hot loops can
+# hoist one `event.get("data") or _EMPTY_DATA` lookup instead of building
+# a fresh empty dict per chained .get call.
+_EMPTY_DATA: dict[str, Any] = {}
+
+# App-name substrings that identify browsers in the timeline view
+_BROWSER_TOKENS = ("chrome", "safari", "firefox", "arc", "edge")
 
 # =============================================================================
 # Behavior View Builders (for AI Analysis)
@@ -21,6 +35,7 @@ def build_timeline_view(
     window_events: list[dict[str, Any]],
     browser_events: list[dict[str, Any]],
     min_duration_seconds: int = 60,
+    presorted: bool = False,
 ) -> str:
     """
     Build a human-readable timeline of application usage.
@@ -32,6 +47,8 @@ def build_timeline_view(
         window_events: List of window events from ActivityWatch.
         browser_events: List of browser events for URL context.
         min_duration_seconds: Minimum event duration to include (filters noise).
+        presorted: Set True when window_events are already sorted by
+            timestamp, to skip the internal sort.
 
     Returns:
         A formatted string showing the app usage timeline.
@@ -48,18 +65,22 @@ def build_timeline_view(
     browser_context: dict[str, str] = {}
     for event in browser_events:
         ts = event.get("timestamp", "")
-        url = event.get("data", {}).get("url", "")
+        url = (event.get("data") or _EMPTY_DATA).get("url", "")
         if ts and url:
             domain = extract_domain(url)
             browser_context[ts[:16]] = domain  # Use minute-level precision
 
-    # Sort window events by timestamp
-    sorted_events = sorted(
-        window_events,
-        key=lambda e: e.get("timestamp", ""),
+    # Sort window events by timestamp unless the caller already did
+    sorted_events = (
+        window_events
+        if presorted
+        else sorted(window_events, key=lambda e: e.get("timestamp", ""))
     )
 
     lines: list[str] = []
+    # The loop sees only a handful of distinct app names, so browser
+    # detection is resolved once per app instead of once per event
+    is_browser_cache: dict[str, bool] = {}
     for event in sorted_events:
         duration = event.get("duration", 0)
         if duration < min_duration_seconds:
@@ -70,8 +91,9 @@ def build_timeline_view(
             continue
 
         end = start + timedelta(seconds=duration)
-        app = event.get("data", {}).get("app", "Unknown")
-        title = event.get("data", {}).get("title", "")
+        data = event.get("data") or _EMPTY_DATA
+        app = data.get("app", "Unknown")
+        title = data.get("title", "")
 
         # Format duration
         duration_min = int(duration / 60)
@@ -82,7 +104,12 @@ def build_timeline_view(
 
         # Add browser context for Chrome/Safari/Firefox
         context = ""
-        if any(browser in app.lower() for browser in ["chrome", "safari", "firefox", "arc", "edge"]):
+        is_browser = is_browser_cache.get(app)
+        if is_browser is None:
+            app_l = app.lower()
+            is_browser = any(token in app_l for token in _BROWSER_TOKENS)
+            is_browser_cache[app] = is_browser
+        if is_browser:
             # Try to find matching browser event
             ts_key = event.get("timestamp", "")[:16]
             if ts_key in browser_context:
@@ -91,7 +118,12 @@ def build_timeline_view(
                 # Extract domain-like info from title
                 context = f" ({title[:30]}...)" if len(title) > 30 else f" ({title})"
 
-        line = f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')} {app}{context} [{duration_str}]"
+        # Format hour:minute directly; strftime's format parsing is
+        # overkill for a fixed HH:MM layout
+        line = (
+            f"{start.hour:02d}:{start.minute:02d}-"
+            f"{end.hour:02d}:{end.minute:02d} {app}{context} [{duration_str}]"
+        )
         lines.append(line)
 
     if not lines:
@@ -104,6 +136,7 @@ def build_session_view(
     window_events: list[dict[str, Any]],
     min_session_minutes: int = 10,
     merge_gap_seconds: int = 120,
+    presorted: bool = False,
 ) -> str:
     """
     Build a view of continuous usage sessions.
@@ -115,6 +148,8 @@ def build_session_view(
         window_events: List of window events.
         min_session_minutes: Minimum session duration to include.
         merge_gap_seconds: Maximum gap between events to merge into same session.
+        presorted: Set True when window_events are already sorted by
+            timestamp, to skip the internal sort.
 
     Returns:
         A formatted string showing continuous usage sessions.
@@ -127,15 +162,32 @@ def build_session_view(
     if not window_events:
         return "（无连续使用记录）"
 
-    # Sort by timestamp
-    sorted_events = sorted(
-        window_events,
-        key=lambda e: e.get("timestamp", ""),
+    # Sort by timestamp unless the caller already did
+    sorted_events = (
+        window_events
+        if presorted
+        else sorted(window_events, key=lambda e: e.get("timestamp", ""))
     )
 
-    # Merge consecutive same-app events into sessions
-    sessions: list[dict[str, Any]] = []
-    current_session: dict[str, Any] | None = None
+    # Merge consecutive same-app events into sessions, emitting each
+    # finished session's line immediately: no intermediate session list
+    # or second filtering pass
+    min_duration_seconds = min_session_minutes * 60
+    lines: list[str] = []
+
+    def emit(app: str, start: datetime, end: datetime, duration: float) -> None:
+        if duration >= min_duration_seconds:
+            duration_min = int(duration / 60)
+            time_range = (
+                f"{start.hour:02d}:{start.minute:02d}-"
+                f"{end.hour:02d}:{end.minute:02d}"
+            )
+            lines.append(f"- {app}: {duration_min}min ({time_range})")
+
+    # The open session travels as one optional (app, start, end,
+    # duration) tuple, unpacked to plain locals after the None check so
+    # the invariant is visible to the type checker
+    current: tuple[str, datetime, datetime, float] | None = None
 
     for event in sorted_events:
         start = parse_timestamp(event.get("timestamp", ""))
@@ -144,34 +196,31 @@ def build_session_view(
 
         duration = event.get("duration", 0)
         end = start + timedelta(seconds=duration)
-        app = event.get("data", {}).get("app", "Unknown")
+        app = (event.get("data") or _EMPTY_DATA).get("app", "Unknown")
 
-        if current_session is None:
-            current_session = {"app": app, "start": start, "end": end, "duration": duration}
-        elif (
-            app == current_session["app"]
-            and (start - current_session["end"]).total_seconds() <= merge_gap_seconds
+        if current is None:
+            current = (app, start, end, duration)
+            continue
+
+        cur_app, cur_start, cur_end, cur_duration = current
+        if (
+            app == cur_app
+            and (start - cur_end).total_seconds() <= merge_gap_seconds
         ):
             # Extend current session
-            current_session["end"] = max(current_session["end"], end)
-            current_session["duration"] += duration
+            current = (
+                cur_app,
+                cur_start,
+                end if end > cur_end else cur_end,
+                cur_duration + duration,
+            )
         else:
-            # Save current session and start new one
-            sessions.append(current_session)
-            current_session = {"app": app, "start": start, "end": end, "duration": duration}
+            # Finish current session and start new one
+            emit(cur_app, cur_start, cur_end, cur_duration)
+            current = (app, start, end, duration)
 
-    if current_session:
-        sessions.append(current_session)
-
-    # Filter by minimum duration and format
-    min_duration_seconds = min_session_minutes * 60
-    lines: list[str] = []
-
-    for session in sessions:
-        if session["duration"] >= min_duration_seconds:
-            duration_min = int(session["duration"] / 60)
-            time_range = f"{session['start'].strftime('%H:%M')}-{session['end'].strftime('%H:%M')}"
-            lines.append(f"- {session['app']}: {duration_min}min ({time_range})")
+    if current is not None:
+        emit(*current)
 
     if not lines:
         return f"（无超过 {min_session_minutes} 分钟的连续使用记录）"
@@ -181,6 +230,7 @@ def build_session_view(
 
 def build_hourly_switches(
     window_events: list[dict[str, Any]],
+    presorted: bool = False,
 ) -> str:
     """
     Build a heatmap of context switches per hour.
@@ -190,6 +240,8 @@ def build_hourly_switches(
 
     Args:
         window_events: List of window events.
+        presorted: Set True when window_events are already sorted by
+            timestamp, to skip the internal sort.
 
     Returns:
         A formatted string showing switches per hour.
@@ -202,14 +254,16 @@ def build_hourly_switches(
     if len(window_events) < 2:
         return "（数据不足，无法分析切换频率）"
 
-    # Sort by timestamp
-    sorted_events = sorted(
-        window_events,
-        key=lambda e: e.get("timestamp", ""),
+    # Sort by timestamp unless the caller already did
+    sorted_events = (
+        window_events
+        if presorted
+        else sorted(window_events, key=lambda e: e.get("timestamp", ""))
     )
 
-    # Count switches per hour
-    hourly_switches: dict[int, int] = defaultdict(int)
+    # Count switches per hour; switch counts are ints, so Counter fits
+    # here even though the float duration tallies use defaultdict
+    hourly_switches: Counter[int] = Counter()
     prev_app: str | None = None
 
     for event in sorted_events:
@@ -217,7 +271,7 @@ def build_hourly_switches(
         if not start:
             continue
 
-        app = event.get("data", {}).get("app", "")
+        app = (event.get("data") or _EMPTY_DATA).get("app", "")
         if prev_app is not None and app != prev_app:
             hourly_switches[start.hour] += 1
         prev_app = app
@@ -270,7 +324,7 @@ def build_website_summary(
     # Aggregate time by domain
     domain_times: dict[str, float] = defaultdict(float)
     for event in browser_events:
-        url = event.get("data", {}).get("url", "")
+        url = (event.get("data") or _EMPTY_DATA).get("url", "")
         duration = event.get("duration", 0)
         if url:
             domain = extract_domain(url)
@@ -279,12 +333,15 @@ def build_website_summary(
     if not domain_times:
         return "（无有效的网站访问记录）"
 
-    # Categorize domains
+    # Categorize domains; lowercase the configured patterns once rather
+    # than per domain, and each domain once rather than per pattern
+    work_lower = tuple(wd.lower() for wd in work_domains)
     work_sites: list[tuple[str, float]] = []
     other_sites: list[tuple[str, float]] = []
 
     for domain, seconds in domain_times.items():
-        is_work = any(wd.lower() in domain.lower() for wd in work_domains)
+        domain_l = domain.lower()
+        is_work = any(wd in domain_l for wd in work_lower)
         if is_work:
             work_sites.append((domain, seconds))
         else:
@@ -314,12 +371,17 @@ def build_website_summary(
     return "\n".join(lines) if lines else "（无有效的网站访问记录）"
 
 
+@lru_cache(maxsize=131072)
 def parse_timestamp(ts_str: str) -> datetime | None:
     """
     Parse an ISO format timestamp string and convert to local time.
 
     ActivityWatch stores timestamps in UTC. This function parses the timestamp
-    and converts it to the local timezone for display.
+    and converts it to the local timezone for display. Results are memoized
+    keyed on the raw string — every event flows through the AFK filter and
+    then one or more view builders, so repeat parses collapse to a cache
+    lookup. The cache is bounded (LRU) so a long-lived process cannot grow
+    it without limit.
 
     Args:
         ts_str: The timestamp string to parse (typically in UTC).
@@ -327,7 +389,31 @@ def parse_timestamp(ts_str: str) -> datetime | None:
     Returns:
         A datetime object in local time if parsing succeeds, None otherwise.
     """
-    from datetime import timezone
+    return _parse_timestamp_uncached(ts_str)
+
+
+def _parse_timestamp_uncached(ts_str: str) -> datetime | None:
+    """
+    Parse an ISO format timestamp string without consulting the cache.
+
+    Tries the C-implemented datetime.fromisoformat first, which covers
+    everything ActivityWatch emits; the strptime format loop remains as
+    a fallback for variants fromisoformat rejects.
+
+    Args:
+        ts_str: The timestamp string to parse (typically in UTC).
+
+    Returns:
+        A datetime object in local time if parsing succeeds, None otherwise.
+    """
+    try:
+        parsed = datetime.fromisoformat(ts_str)
+    except ValueError:
+        pass
+    else:
+        if parsed.tzinfo is not None:
+            return parsed.astimezone().replace(tzinfo=None)
+        return parsed
 
     formats_with_tz = [
         "%Y-%m-%dT%H:%M:%S.%f%z",
@@ -373,25 +459,40 @@ def seconds_to_hours(seconds: float) -> float:
     return round(seconds / 3600, 1)
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract the domain from a URL.
 
+    Uses a micro-parser instead of urlparse: browser events only ever
+    need the netloc, so slicing between '://' and the first path/query/
+    fragment separator avoids urlparse's full six-component split on
+    every event. Results are memoized — browser watchers emit the same
+    URL across many consecutive events, so repeats collapse to a cache
+    hit.
+
     Args:
         url: The URL to parse.
 
     Returns:
         The domain name, or "unknown" if extraction fails.
     """
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        if domain.startswith("www."):
-            domain = domain[4:]
-        return domain or "unknown"
-    except Exception:
+    scheme_end = url.find("://")
+    if scheme_end == -1:
         return "unknown"
 
+    start = scheme_end + 3
+    end = len(url)
+    for sep in ("/", "?", "#"):
+        idx = url.find(sep, start, end)
+        if idx != -1:
+            end = idx
+
+    domain = url[start:end]
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain or "unknown"
+
 
 class AFKFilter:
     """
@@ -401,8 +502,8 @@ class AFKFilter:
     other events to only include those that overlap with active periods.
 
     Attributes:
-        active_periods: List of (start, end) datetime tuples representing
-            periods when the user was not AFK.
+        active_periods: Sorted, non-overlapping list of (start, end)
+            datetime tuples representing periods when the user was not AFK.
     """
 
     def __init__(self, afk_events: list[dict[str, Any]]) -> None:
@@ -413,6 +514,11 @@ class AFKFilter:
             afk_events: List of AFK events from ActivityWatch.
         """
         self.active_periods = self._get_not_afk_periods(afk_events)
+        # Parallel POSIX-second columns for binary-searched lookups:
+        # float comparisons and arithmetic in the per-event hot path are
+        # cheaper than datetime/timedelta object churn.
+        self._starts_ts = [start.timestamp() for start, _ in self.active_periods]
+        self._ends_ts = [end.timestamp() for _, end in self.active_periods]
 
     def _get_not_afk_periods(
         self,
@@ -421,21 +527,39 @@ class AFKFilter:
         """
         Extract all non-AFK time periods from AFK events.
 
+        The periods are sorted by start time and overlapping or touching
+        periods are merged, so the result is a canonical disjoint
+        interval list that overlap queries can search efficiently.
+
         Args:
             afk_events: List of AFK events.
 
         Returns:
-            List of (start, end) tuples for active periods.
+            Sorted list of disjoint (start, end) tuples for active periods.
         """
         periods: list[tuple[datetime, datetime]] = []
         for event in afk_events:
-            if event.get("data", {}).get("status") == "not-afk":
+            if (event.get("data") or _EMPTY_DATA).get("status") == "not-afk":
                 start = parse_timestamp(event.get("timestamp", ""))
                 duration = event.get("duration", 0)
                 if start and duration > 0:
                     end = start + timedelta(seconds=duration)
                     periods.append((start, end))
-        return periods
+
+        if not periods:
+            return periods
+
+        # Merge into disjoint intervals
+        periods.sort()
+        merged = [periods[0]]
+        for start, end in periods[1:]:
+            last_start, last_end = merged[-1]
+            if start <= last_end:
+                if end > last_end:
+                    merged[-1] = (last_start, end)
+            else:
+                merged.append((start, end))
+        return merged
 
     def is_in_active_period(
         self,
@@ -456,13 +580,14 @@ class AFKFilter:
         if not self.active_periods:
             return True  # No AFK data means we consider all events as active
 
-        event_end = event_time + timedelta(seconds=event_duration)
-
-        for period_start, period_end in self.active_periods:
-            # Check for any overlap between event and active period
-            if event_time < period_end and event_end > period_start:
-                return True
-        return False
+        # Work in POSIX seconds: one conversion per event instead of a
+        # datetime + timedelta allocation. The periods are sorted and
+        # disjoint, so the only candidate is the last period starting
+        # before the event ends; the event overlaps iff that period also
+        # ends after the event starts.
+        event_ts = event_time.timestamp()
+        idx = bisect_left(self._starts_ts, event_ts + event_duration) - 1
+        return idx >= 0 and self._ends_ts[idx] > event_ts
 
     def filter_events(
         self,
@@ -480,21 +605,79 @@ class AFKFilter:
         if not self.active_periods:
             return events
 
-        filtered: list[dict[str, Any]] = []
+        # Short-circuit for a single merged active period (a continuous
+        # stretch at the keyboard): the overlap test collapses to two
+        # scalar comparisons, no bisect needed.
+        if len(self.active_periods) == 1:
+            period_start = self._starts_ts[0]
+            period_end = self._ends_ts[0]
+            return [
+                event
+                for event in events
+                if (event_time := parse_timestamp(event.get("timestamp", "")))
+                and (event_ts := event_time.timestamp()) < period_end
+                and event_ts + event.get("duration", 0) > period_start
+            ]
+
+        # Single mask-style pass: parse each timestamp once and select
+        # the overlapping events in one comprehension
+        is_active = self.is_in_active_period
+        return [
+            event
+            for event in events
+            if (event_time := parse_timestamp(event.get("timestamp", "")))
+            and is_active(event_time, event.get("duration", 0))
+        ]
+
+    def iter_active(
+        self,
+        events: Iterable[dict[str, Any]],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield events that overlap active periods, without building a list.
+
+        Streaming counterpart to filter_events for consumers that only
+        walk the events once (e.g., straight into an aggregation loop).
+
+        Args:
+            events: Events to filter.
+
+        Yields:
+            Events that overlap with an active period.
+        """
+        if not self.active_periods:
+            yield from events
+            return
+
+        is_active = self.is_in_active_period
         for event in events:
             event_time = parse_timestamp(event.get("timestamp", ""))
-            event_duration = event.get("duration", 0)
+            if event_time and is_active(event_time, event.get("duration", 0)):
+                yield event
 
-            if event_time and self.is_in_active_period(event_time, event_duration):
-                filtered.append(event)
+    def total_active_seconds(self) -> float:
+        """
+        Calculate total active (not-AFK) time in seconds.
+
+        Sums the lengths of the merged active periods directly, so it
+        costs O(periods) instead of rescanning the raw AFK events — and
+        overlapping not-afk events are not double-counted.
 
-        return filtered
+        Returns:
+            Total seconds covered by the active periods.
+        """
+        return sum(
+            end - start for start, end in zip(self._starts_ts, self._ends_ts)
+        )
 
     @staticmethod
     def get_total_active_seconds(afk_events: list[dict[str, Any]]) -> float:
         """
         Calculate total active (not-AFK) time in seconds.
 
+        Sums raw event durations; prefer total_active_seconds on a
+        constructed filter, which reads the merged periods instead.
+
         Args:
             afk_events: List of AFK events.
 
@@ -504,7 +687,7 @@ class AFKFilter:
         return sum(
             e.get("duration", 0)
             for e in afk_events
-            if e.get("data", {}).get("status") == "not-afk"
+            if (e.get("data") or _EMPTY_DATA).get("status") == "not-afk"
         )
 
 
@@ -528,23 +711,48 @@ class DataAggregator:
                 Example: {"coding": ["VS Code", "PyCharm"], "browser": ["Chrome"]}
         """
         self.categories = categories
+        # One compiled alternation per category, kept in dict order so
+        # the first-category-wins priority of the config is preserved.
+        # Matching a category is then a single C-level scan instead of a
+        # Python loop over its patterns.
+        self._category_patterns = [
+            (
+                category,
+                re.compile("|".join(re.escape(app.lower()) for app in apps)),
+            )
+            for category, apps in categories.items()
+            if apps
+        ]
+        # Memoized app -> category results; the distinct app-name set is
+        # tiny compared to the event count.
+        self._category_cache: dict[str, str] = {}
 
     def categorize_app(self, app_name: str) -> str:
         """
         Determine the category for an application.
 
+        Results are memoized per app name, so repeated events from the
+        same application skip the pattern scan entirely.
+
         Args:
             app_name: The name of the application.
 
         Returns:
             The category name, or "other" if no match is found.
         """
+        cached = self._category_cache.get(app_name)
+        if cached is not None:
+            return cached
+
         app_lower = app_name.lower()
-        for category, apps in self.categories.items():
-            for app in apps:
-                if app.lower() in app_lower:
-                    return category
-        return "other"
+        category = "other"
+        for candidate, pattern in self._category_patterns:
+            if pattern.search(app_lower):
+                category = candidate
+                break
+
+        self._category_cache[app_name] = category
+        return category
 
     def aggregate_by_app(
         self,
@@ -559,12 +767,12 @@ class DataAggregator:
         Returns:
             Dictionary mapping app names to total duration in seconds.
         """
-        app_times: dict[str, float] = defaultdict(float)
+        app_times: defaultdict[str, float] = defaultdict(float)
         for event in events:
-            app = event.get("data", {}).get("app", "Unknown")
+            app = (event.get("data") or _EMPTY_DATA).get("app", "Unknown")
             duration = event.get("duration", 0)
             app_times[app] += duration
-        return dict(app_times)
+        return app_times
 
     def aggregate_by_category(
         self,
@@ -579,11 +787,38 @@ class DataAggregator:
         Returns:
             Dictionary mapping category names to total duration in seconds.
         """
-        category_times: dict[str, float] = defaultdict(float)
+        category_times: defaultdict[str, float] = defaultdict(float)
         for app, seconds in app_times.items():
             category = self.categorize_app(app)
             category_times[category] += seconds
-        return dict(category_times)
+        return category_times
+
+    def aggregate_window(
+        self,
+        events: list[dict[str, Any]],
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """
+        Aggregate window events by app and category in a single pass.
+
+        Fuses aggregate_by_app and aggregate_by_category so the event
+        list is only walked once; the category lookup rides the memoized
+        categorize_app cache.
+
+        Args:
+            events: List of window events.
+
+        Returns:
+            A tuple of (app_times, category_times), each mapping names to
+            total duration in seconds.
+        """
+        app_times: defaultdict[str, float] = defaultdict(float)
+        category_times: defaultdict[str, float] = defaultdict(float)
+        for event in events:
+            app = (event.get("data") or _EMPTY_DATA).get("app", "Unknown")
+            duration = event.get("duration", 0)
+            app_times[app] += duration
+            category_times[self.categorize_app(app)] += duration
+        return app_times, category_times
 
     def aggregate_browser_domains(
         self,
@@ -598,49 +833,49 @@ class DataAggregator:
         Returns:
             Dictionary mapping domain names to total duration in seconds.
         """
-        domain_times: dict[str, float] = defaultdict(float)
+        domain_times: defaultdict[str, float] = defaultdict(float)
         for event in events:
-            url = event.get("data", {}).get("url", "")
+            url = (event.get("data") or _EMPTY_DATA).get("url", "")
             duration = event.get("duration", 0)
             if url:
                 domain = extract_domain(url)
                 domain_times[domain] += duration
-        return dict(domain_times)
+        return domain_times
 
     def aggregate_editor_stats(
         self,
-        events: list[dict[str, Any]],
+        events: Iterable[dict[str, Any]],
     ) -> dict[str, dict[str, float]]:
         """
         Aggregate editor event statistics by language and project.
 
         Args:
-            events: List of editor events.
+            events: Editor events; any iterable, consumed once.
 
         Returns:
             Dictionary with "by_language" and "by_project" sub-dictionaries,
             each mapping names to total duration in seconds.
         """
-        language_times: dict[str, float] = defaultdict(float)
-        project_times: dict[str, float] = defaultdict(float)
+        language_times: defaultdict[str, float] = defaultdict(float)
+        project_times: defaultdict[str, float] = defaultdict(float)
 
         for event in events:
-            data = event.get("data", {})
+            data = event.get("data") or _EMPTY_DATA
             duration = event.get("duration", 0)
 
             language = data.get("language", "unknown")
             project = data.get("project", "unknown")
 
             # Simplify project path to just the directory name
-            if project and "/" in project:
-                project = project.rstrip("/").split("/")[-1]
+            if project:
+                project = os.path.basename(project.rstrip("/"))
 
             language_times[language] += duration
             project_times[project] += duration
 
         return {
-            "by_language": dict(language_times),
-            "by_project": dict(project_times),
+            "by_language": language_times,
+            "by_project": project_times,
         }
 
 
@@ -700,51 +935,74 @@ class DataProcessor:
         browser_events = raw_data.get("browser", [])
         editor_events = raw_data.get("editor", [])
 
-        # Step 1: AFK filtering
+        # Step 1: AFK filtering. The three passes are pure-Python CPU
+        # work, so they run sequentially — threading them would just
+        # serialize on the GIL. Streams without events skip the filter
+        # machinery entirely (browser/editor watchers are optional).
         afk_filter = AFKFilter(afk_events)
-        filtered_window = afk_filter.filter_events(window_events)
-        filtered_browser = afk_filter.filter_events(browser_events)
-        filtered_editor = afk_filter.filter_events(editor_events)
+        filtered_window = (
+            afk_filter.filter_events(window_events) if window_events else []
+        )
+        filtered_browser = (
+            afk_filter.filter_events(browser_events) if browser_events else []
+        )
+        # Editor events are only consumed once (by the aggregation), so
+        # they stream through the filter instead of materializing a list
+        filtered_editor = (
+            afk_filter.iter_active(editor_events) if editor_events else iter(())
+        )
 
-        # Step 2: Calculate active time
-        not_afk_seconds = AFKFilter.get_total_active_seconds(afk_events)
+        # Step 2: Calculate active time from the merged periods
+        not_afk_seconds = afk_filter.total_active_seconds()
 
-        # Step 3: Window data aggregation
-        app_times = self.aggregator.aggregate_by_app(filtered_window)
-        category_times = self.aggregator.aggregate_by_category(app_times)
+        # Step 3: Window data aggregation (app + category in one pass)
+        app_times, category_times = self.aggregator.aggregate_window(
+            filtered_window
+        )
         total_seconds = sum(app_times.values())
 
-        app_times_sorted = sorted(app_times.items(), key=lambda x: -x[1])
+        # Top-N selections use a heap (O(n log k)) instead of fully
+        # sorting tables that are mostly discarded; categories are few
+        # and reported in full, so they keep the plain sort.
+        top_apps = nlargest(10, app_times.items(), key=itemgetter(1))
         category_times_sorted = sorted(category_times.items(), key=lambda x: -x[1])
 
         # Step 4: Browser data aggregation
         domain_times = self.aggregator.aggregate_browser_domains(filtered_browser)
-        domain_times_sorted = sorted(domain_times.items(), key=lambda x: -x[1])
+        top_domains = nlargest(10, domain_times.items(), key=itemgetter(1))
         browser_total = sum(domain_times.values())
 
         # Step 5: Editor data aggregation
         editor_stats = self.aggregator.aggregate_editor_stats(filtered_editor)
         editor_total = sum(editor_stats["by_language"].values())
-        language_sorted = sorted(
-            editor_stats["by_language"].items(), key=lambda x: -x[1]
+        top_languages = nlargest(
+            5, editor_stats["by_language"].items(), key=itemgetter(1)
         )
-        project_sorted = sorted(
-            editor_stats["by_project"].items(), key=lambda x: -x[1]
+        top_projects = nlargest(
+            5, editor_stats["by_project"].items(), key=itemgetter(1)
         )
 
-        # Step 6: Build behavior views for AI analysis
+        # Step 6: Build behavior views for AI analysis. The window
+        # events are sorted once here and shared by all three views.
+        sorted_window = sorted(
+            filtered_window, key=lambda e: e.get("timestamp", "")
+        )
         views = {
             "timeline": build_timeline_view(
-                filtered_window,
+                sorted_window,
                 filtered_browser,
                 min_duration_seconds=60,
+                presorted=True,
             ),
             "sessions": build_session_view(
-                filtered_window,
+                sorted_window,
                 min_session_minutes=10,
                 merge_gap_seconds=120,
+                presorted=True,
+            ),
+            "hourly_switches": build_hourly_switches(
+                sorted_window, presorted=True
             ),
-            "hourly_switches": build_hourly_switches(filtered_window),
             "website_summary": build_website_summary(
                 filtered_browser,
                 work_domains=self.work_domains,
@@ -755,7 +1013,7 @@ class DataProcessor:
             "total_hours": seconds_to_hours(total_seconds),
             "not_afk_hours": seconds_to_hours(not_afk_seconds),
             "by_app": [
-                (app, seconds_to_hours(s)) for app, s in app_times_sorted[:10]
+                (app, seconds_to_hours(s)) for app, s in top_apps
             ],
             "by_category": [
                 (cat, seconds_to_hours(s)) for cat, s in category_times_sorted
@@ -763,16 +1021,16 @@ class DataProcessor:
             "browser": {
                 "total_hours": seconds_to_hours(browser_total),
                 "top_domains": [
-                    (d, seconds_to_hours(s)) for d, s in domain_times_sorted[:10]
+                    (d, seconds_to_hours(s)) for d, s in top_domains
                 ],
             },
             "editor": {
                 "total_hours": seconds_to_hours(editor_total),
                 "by_language": [
-                    (lang, seconds_to_hours(s)) for lang, s in language_sorted[:5]
+                    (lang, seconds_to_hours(s)) for lang, s in top_languages
                 ],
                 "by_project": [
-                    (proj, seconds_to_hours(s)) for proj, s in project_sorted[:5]
+                    (proj, seconds_to_hours(s)) for proj, s in top_projects
                 ],
             },
             "event_counts": {
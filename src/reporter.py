@@ -7,10 +7,96 @@ as well as console output for progress indication.
 
 from __future__ import annotations
 
+import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+# Progress output goes through logging so callers can silence or
+# redirect it; the NullHandler keeps the library quiet unless the
+# application configures a handler (main() installs a bare-message
+# stdout handler).
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _ymd(dt: datetime) -> str:
+    """
+    Format a datetime as YYYY-MM-DD without going through strftime.
+
+    strftime re-parses its format string and touches locale state on
+    every call; the reports only ever need this one fixed shape.
+
+    Args:
+        dt: The datetime to format.
+
+    Returns:
+        The date as a YYYY-MM-DD string.
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _ymdhm(dt: datetime) -> str:
+    """
+    Format a datetime as YYYY-MM-DD HH:MM without going through strftime.
+
+    Args:
+        dt: The datetime to format.
+
+    Returns:
+        The timestamp as a YYYY-MM-DD HH:MM string.
+    """
+    return f"{_ymd(dt)} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# Report layout, hoisted to module level so the literal segments are
+# built once; generate_markdown only interpolates the dynamic fields.
+_REPORT_TEMPLATE = """# 个人效率报告
+> {period_name} | {start_date} ~ {end_date}
+> 生成时间: {generated_at}
+
+---
+
+## 📊 AI 分析
+
+{ai_report}
+
+---
+
+## 📈 统计数据
+
+{data_summary}
+{views_section}
+"""
+
+_VIEWS_TEMPLATE = """
+---
+
+## 📋 行为视图
+
+### 应用使用时间线
+> 展示应用切换的时间序列，带持续时长。时间为本机记录时间。
+
+```
+{timeline}
+```
+
+### 连续使用段落
+> 相邻同应用事件合并后的使用段落（超过10分钟的）
+
+```
+{sessions}
+```
+
+### 各小时切换频率
+> 每小时应用切换次数，可反映注意力碎片化程度
+
+```
+{hourly_switches}
+```
+"""
+
 
 class ReportGenerator:
     """
@@ -35,6 +121,9 @@ class ReportGenerator:
             output_dir: Directory path for saving reports. Defaults to "./reports".
         """
         self.output_dir = output_dir
+        # Set once the output directory is known to exist, so repeat
+        # saves skip the makedirs syscall
+        self._dir_ready = False
 
     def generate_markdown(
         self,
@@ -44,6 +133,8 @@ class ReportGenerator:
         end: datetime,
         period_name: str,
         views: dict[str, str] | None = None,
+        *,
+        now: datetime | None = None,
     ) -> str:
         """
         Generate complete Markdown report content.
@@ -55,6 +146,10 @@ class ReportGenerator:
             end: End datetime of the report period.
             period_name: Human-readable name for the period.
             views: Optional dictionary containing behavior views (timeline, sessions, etc.).
+            now: Generation timestamp to stamp into the report. Batch
+                callers can sample datetime.now() once and share it so
+                every report in the batch carries the same 生成时间.
+                Defaults to the current time.
 
         Returns:
             The complete Markdown report as a string.
@@ -62,56 +157,73 @@ class ReportGenerator:
         # Build behavior views section if available
         views_section = ""
         if views:
-            timeline = views.get("timeline", "")
-            sessions = views.get("sessions", "")
-            hourly_switches = views.get("hourly_switches", "")
-
-            views_section = f"""
----
-
-## 📋 行为视图
-
-### 应用使用时间线
-> 展示应用切换的时间序列，带持续时长。时间为本机记录时间。
-
-```
-{timeline}
-```
-
-### 连续使用段落
-> 相邻同应用事件合并后的使用段落（超过10分钟的）
-
-```
-{sessions}
-```
-
-### 各小时切换频率
-> 每小时应用切换次数，可反映注意力碎片化程度
-
-```
-{hourly_switches}
-```
-"""
+            views_section = _VIEWS_TEMPLATE.format(
+                timeline=views.get("timeline", ""),
+                sessions=views.get("sessions", ""),
+                hourly_switches=views.get("hourly_switches", ""),
+            )
+
+        return _REPORT_TEMPLATE.format(
+            period_name=period_name,
+            start_date=_ymd(start),
+            end_date=_ymd(end),
+            generated_at=_ymdhm(now if now is not None else datetime.now()),
+            ai_report=ai_report,
+            data_summary=data_summary,
+            views_section=views_section,
+        )
 
-        return f"""# 个人效率报告
-> {period_name} | {start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}
-> 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+    def save(
+        self,
+        ai_report: str,
+        data_summary: str,
+        start: datetime,
+        end: datetime,
+        period_name: str,
+        views: dict[str, str] | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        Save the report to a Markdown file.
 
----
+        Creates the output directory if it doesn't exist.
 
-## 📊 AI 分析
+        Args:
+            ai_report: The AI-generated analysis text.
+            data_summary: The formatted data summary.
+            start: Start datetime of the report period.
+            end: End datetime of the report period.
+            period_name: Human-readable name for the period.
+            views: Optional dictionary containing behavior views.
+            now: Generation timestamp forwarded to generate_markdown.
 
-{ai_report}
+        Returns:
+            The path to the saved report file.
+        """
+        if not self._dir_ready:
+            # exist_ok makes this idempotent, so concurrent first saves
+            # racing here are harmless
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._dir_ready = True
+
+        date_str = _ymd(end)
+        filename = os.path.join(
+            self.output_dir, f"report_{period_name}_{date_str}.md"
+        )
 
----
+        content = self.generate_markdown(
+            ai_report, data_summary, start, end, period_name, views, now=now
+        )
 
-## 📈 统计数据
+        # Encode once and write the bytes directly, skipping the
+        # TextIOWrapper's incremental encode pass
+        with open(filename, "wb") as f:
+            f.write(content.encode("utf-8"))
 
-{data_summary}
-{views_section}
-"""
+        return filename
 
-    def save(
+    async def save_async(
         self,
         ai_report: str,
         data_summary: str,
@@ -121,9 +233,12 @@ class ReportGenerator:
         views: dict[str, str] | None = None,
     ) -> str:
         """
-        Save the report to a Markdown file.
+        Save the report without blocking the event loop.
 
-        Creates the output directory if it doesn't exist.
+        Runs the blocking makedirs/open/write of save in a worker thread
+        via asyncio.to_thread, so async callers (e.g. batched report
+        runs overlapping AI calls) keep the loop free while reports hit
+        disk.
 
         Args:
             ai_report: The AI-generated analysis text.
@@ -136,19 +251,65 @@ class ReportGenerator:
         Returns:
             The path to the saved report file.
         """
-        os.makedirs(self.output_dir, exist_ok=True)
-
-        date_str = end.strftime("%Y-%m-%d")
-        filename = f"{self.output_dir}/report_{period_name}_{date_str}.md"
+        import asyncio
 
-        content = self.generate_markdown(
-            ai_report, data_summary, start, end, period_name, views
+        return await asyncio.to_thread(
+            self.save, ai_report, data_summary, start, end, period_name, views
         )
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
+    async def save_many_async(
+        self,
+        jobs: list[tuple[Any, ...]],
+        concurrency: int = 8,
+    ) -> list[str]:
+        """
+        Save several reports concurrently.
 
-        return filename
+        Writes overlap in worker threads, capped by a semaphore so a
+        large batch cannot saturate the disk or thread pool. All reports
+        in the batch share one generation timestamp.
+
+        Args:
+            jobs: Argument tuples for save, one per report:
+                (ai_report, data_summary, start, end, period_name)
+                optionally followed by views.
+            concurrency: Maximum number of in-flight writes.
+
+        Returns:
+            The saved file paths, in job order.
+        """
+        import asyncio
+
+        sem = asyncio.Semaphore(concurrency)
+        now = datetime.now()
+
+        async def _one(job: tuple[Any, ...]) -> str:
+            async with sem:
+                return await asyncio.to_thread(self.save, *job, now=now)
+
+        return list(await asyncio.gather(*(_one(job) for job in jobs)))
+
+
+@lru_cache(maxsize=16)
+def get_generator(output_dir: str = "./reports") -> ReportGenerator:
+    """
+    Return a shared ReportGenerator for an output directory.
+
+    Long-running callers that produce reports per period should prefer
+    this over constructing ReportGenerator directly: the same instance
+    (and whatever state it has warmed up) is reused per directory.
+
+    Args:
+        output_dir: Directory path for saving reports.
+
+    Returns:
+        A cached ReportGenerator bound to output_dir.
+    """
+    return ReportGenerator(output_dir)
+
+
+# Banner rule shared by the console helpers, built once
+_RULE = "=" * 50
 
 
 class ConsolePrinter:
@@ -157,14 +318,18 @@ class ConsolePrinter:
 
     All methods are static and handle printing progress messages,
     statistics, and reports to the console with consistent formatting.
+    Messages are emitted through the module logger at INFO level, so a
+    --quiet mode or tests can disable them by logger configuration; the
+    isEnabledFor guards skip the string formatting entirely when the
+    logger is off.
     """
 
     @staticmethod
     def print_header() -> None:
         """Print the application header banner."""
-        print("=" * 50)
-        print("🚀 个人效率感知系统")
-        print("=" * 50)
+        # Each method emits one log record so multi-line messages reach
+        # the stream in a single write instead of one syscall per line
+        logger.info("%s\n🚀 个人效率感知系统\n%s", _RULE, _RULE)
 
     @staticmethod
     def print_period(period_name: str, start: datetime, end: datetime) -> None:
@@ -176,15 +341,14 @@ class ConsolePrinter:
             start: Start datetime.
             end: End datetime.
         """
-        print(
-            f"\n📅 {period_name}: "
-            f"{start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}"
-        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("\n📅 %s: %s ~ %s", period_name, _ymd(start), _ymd(end))
 
     @staticmethod
     def print_collecting() -> None:
         """Print the data collection status message."""
-        print("\n📊 正在采集数据...")
+        logger.info("\n📊 正在采集数据...")
 
     @staticmethod
     def print_buckets_info(info: dict[str, Any]) -> None:
@@ -194,10 +358,14 @@ class ConsolePrinter:
         Args:
             info: Dictionary containing bucket information.
         """
-        print(f"   - Window: {info.get('window', '未找到')}")
-        print(f"   - AFK: {info.get('afk') or '未找到'}")
-        print(f"   - Browser: {info.get('browser') or '未找到'}")
-        print(f"   - Editors: {info.get('editor_count', 0)} 个")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            f"   - Window: {info.get('window', '未找到')}\n"
+            f"   - AFK: {info.get('afk') or '未找到'}\n"
+            f"   - Browser: {info.get('browser') or '未找到'}\n"
+            f"   - Editors: {info.get('editor_count', 0)} 个"
+        )
 
     @staticmethod
     def print_event_counts(counts: dict[str, int]) -> None:
@@ -207,16 +375,20 @@ class ConsolePrinter:
         Args:
             counts: Dictionary mapping event types to counts.
         """
-        print("\n   事件数量:")
-        print(f"   - Window: {counts.get('window', 0)}")
-        print(f"   - AFK: {counts.get('afk', 0)}")
-        print(f"   - Browser: {counts.get('browser', 0)}")
-        print(f"   - Editor: {counts.get('editor', 0)}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "\n   事件数量:\n"
+            f"   - Window: {counts.get('window', 0)}\n"
+            f"   - AFK: {counts.get('afk', 0)}\n"
+            f"   - Browser: {counts.get('browser', 0)}\n"
+            f"   - Editor: {counts.get('editor', 0)}"
+        )
 
     @staticmethod
     def print_processing() -> None:
         """Print the data processing status message."""
-        print("\n⚙️  正在处理数据...")
+        logger.info("\n⚙️  正在处理数据...")
 
     @staticmethod
     def print_stats_summary(stats: dict[str, Any]) -> None:
@@ -226,20 +398,24 @@ class ConsolePrinter:
         Args:
             stats: Processed statistics dictionary.
         """
-        print(f"   - 总时长: {stats['total_hours']} 小时")
-        print(f"   - 活跃时长: {stats['not_afk_hours']} 小时")
-        print(f"   - 编程时长: {stats['editor']['total_hours']} 小时")
-        print(f"   - 浏览器时长: {stats['browser']['total_hours']} 小时")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            f"   - 总时长: {stats['total_hours']} 小时\n"
+            f"   - 活跃时长: {stats['not_afk_hours']} 小时\n"
+            f"   - 编程时长: {stats['editor']['total_hours']} 小时\n"
+            f"   - 浏览器时长: {stats['browser']['total_hours']} 小时"
+        )
 
     @staticmethod
     def print_ai_calling() -> None:
         """Print the AI API call status message."""
-        print("\n🤖 正在调用 AI 分析...")
+        logger.info("\n🤖 正在调用 AI 分析...")
 
     @staticmethod
     def print_ai_skipped() -> None:
         """Print the AI skipped status message."""
-        print("\n⏭️  跳过 AI 分析")
+        logger.info("\n⏭️  跳过 AI 分析")
 
     @staticmethod
     def print_saved(filename: str) -> None:
@@ -249,7 +425,7 @@ class ConsolePrinter:
         Args:
             filename: Path to the saved report file.
         """
-        print(f"\n💾 报告已保存: {filename}")
+        logger.info("\n💾 报告已保存: %s", filename)
 
     @staticmethod
     def print_report(report: str) -> None:
@@ -259,11 +435,41 @@ class ConsolePrinter:
         Args:
             report: The report content to display.
         """
-        print("\n" + "=" * 50)
-        print("📋 效率分析报告")
-        print("=" * 50)
-        print(report)
-        print("\n" + "=" * 50)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "\n%s\n📋 效率分析报告\n%s\n%s\n\n%s", _RULE, _RULE, report, _RULE
+        )
+
+    @staticmethod
+    def print_report_from_file(path: str) -> None:
+        """
+        Print a saved report by streaming it from disk.
+
+        Callers that just saved the report can display it without
+        holding the full string: the file bytes are copied to stdout in
+        64 KB blocks, skipping the text-codec round trip.
+
+        Args:
+            path: Path to the saved report file.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        import shutil
+        import sys
+
+        # The report body streams to stdout directly; only the banners
+        # go through the logger, flushed so the interleaving holds when
+        # the configured handler also writes to stdout
+        logger.info("\n%s\n📋 效率分析报告\n%s", _RULE, _RULE)
+        sys.stdout.flush()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, sys.stdout.buffer, 65536)
+        sys.stdout.buffer.flush()
+        # Saved reports end with a newline of their own, so one more
+        # blank line matches print_report's spacing
+        logger.info("\n%s", _RULE)
 
     @staticmethod
     def print_error(message: str) -> None:
@@ -273,4 +479,4 @@ class ConsolePrinter:
         Args:
             message: The error message to display.
         """
-        print(f"❌ {message}")
+        logger.error("❌ %s", message)